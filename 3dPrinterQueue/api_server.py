@@ -4,10 +4,11 @@ import os
 
 
 class APIServer:
-    def __init__(self, print_queue, printer_controller):
+    def __init__(self, print_queue, printer_controller, telemetry_store):
         self.app = Flask(__name__)
         self.queue = print_queue
         self.printer = printer_controller
+        self.telemetry = telemetry_store
         self._setup_routes()
 
     def _setup_routes(self):
@@ -68,6 +69,33 @@ class APIServer:
                     'error': f'Job {job_id} not found'
                 }), 404
 
+        @self.app.route('/queue/job/<job_id>/telemetry', methods=['GET'])
+        def get_job_telemetry(job_id):
+            job = self.queue.get_job_by_id(job_id)
+
+            if not job:
+                return jsonify({
+                    'error': f'Job {job_id} not found'
+                }), 404
+
+            start = request.args.get('start', type=float)
+            end = request.args.get('end', type=float)
+            resolution = request.args.get('resolution', type=int)
+
+            telemetry = self.telemetry.get_telemetry(job_id, start, end, resolution)
+
+            if telemetry is None:
+                return jsonify({
+                    'error': f'No telemetry recorded for job {job_id}',
+                    'current_status': job['status']
+                }), 404
+
+            return jsonify({
+                'job_id': job_id,
+                'status': job['status'],
+                **telemetry
+            }), 200
+
         @self.app.route('/queue/completed', methods=['GET'])
         def get_completed_jobs():
             limit = request.args.get('limit', 10, type=int)
@@ -0,0 +1,107 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+import zipfile
+from io import BytesIO
+from gcode_preprocessor import GCODE_LOCATION, create_preprocessed_3mf
+
+
+def package_raw(file_path: str):
+    # Mirrors PrinterController.create_3mf_from_gcode without needing a printer connection
+    start_time = time.perf_counter()
+    with open(file_path, 'r') as file:
+        gcode = file.read()
+
+    zip_buffer = BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        zipf.writestr(GCODE_LOCATION, gcode)
+
+    return zip_buffer.tell(), time.perf_counter() - start_time
+
+
+def package_preprocessed(file_path: str):
+    start_time = time.perf_counter()
+    zip_buffer, stats = create_preprocessed_3mf(file_path)
+    return stats['archive_bytes'], time.perf_counter() - start_time
+
+
+def extract_gcode(file_path: str, output_dir: str) -> str:
+    # Pull the plate G-code out of a sliced .3mf so it can be benchmarked as plain G-code
+    with zipfile.ZipFile(file_path) as zipf:
+        gcode_path = os.path.join(output_dir, os.path.basename(file_path) + '.gcode')
+        with open(gcode_path, 'wb') as f:
+            f.write(zipf.read(GCODE_LOCATION))
+    return gcode_path
+
+
+def generate_gcode(output_dir: str, size_mb: int) -> str:
+    # Synthetic slicer-style output: verbose comments and six-decimal coordinates
+    gcode_path = os.path.join(output_dir, f'synthetic_{size_mb}mb.gcode')
+    rng = random.Random(0)
+    target_size = size_mb * 1024 * 1024
+    layer = 0
+
+    with open(gcode_path, 'w') as f:
+        f.write('; HEADER_BLOCK_START\n; generated for benchmarking\n; HEADER_BLOCK_END\n\n')
+        while f.tell() < target_size:
+            layer += 1
+            f.write(f'; CHANGE_LAYER\n; Z_HEIGHT: {layer * 0.2:.2f}\n; LAYER_HEIGHT: 0.2\n')
+            f.write(f'G1 Z{layer * 0.2:.6f} F600.000000 ; move to next layer\n')
+            f.write('; FEATURE: Outer wall\n; LINE_WIDTH: 0.42\n')
+            for _ in range(500):
+                f.write(f'G1  X{rng.uniform(0, 256):.6f} Y{rng.uniform(0, 256):.6f} '
+                        f'E{rng.uniform(0, 0.1):.6f}   ; extrude segment\n')
+            f.write('; WIPE_START\nG1 E-0.800000 F1800.000000\n; WIPE_END\n')
+
+    return gcode_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare raw and preprocessed G-code uploads')
+    parser.add_argument('files', nargs='*', help='.gcode or sliced .3mf files to benchmark')
+    parser.add_argument('--generate-mb', type=int, default=0,
+                        help='Also benchmark a synthetic G-code file of this size in MB')
+    parser.add_argument('--link-kbps', type=float, default=1000.0,
+                        help='Assumed upload speed to the printer in KB/s')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files = []
+        for file_path in args.files:
+            if file_path.endswith('.3mf'):
+                files.append(extract_gcode(file_path, temp_dir))
+            else:
+                files.append(file_path)
+
+        if args.generate_mb:
+            files.append(generate_gcode(temp_dir, args.generate_mb))
+
+        if not files:
+            parser.error('Provide at least one file or --generate-mb')
+
+        link_bytes_per_second = args.link_kbps * 1024
+
+        for file_path in files:
+            input_bytes = os.path.getsize(file_path)
+            print(f'\n{os.path.basename(file_path)} ({input_bytes} bytes)')
+            print(f'  {"mode":<14}{"upload bytes":>14}{"package s":>12}{"upload s":>12}{"start s":>12}')
+
+            results = [
+                ('raw', package_raw(file_path)),
+                ('preprocessed', package_preprocessed(file_path)),
+            ]
+
+            for mode, (archive_bytes, package_seconds) in results:
+                upload_seconds = archive_bytes / link_bytes_per_second
+                print(f'  {mode:<14}{archive_bytes:>14}{package_seconds:>12.3f}'
+                      f'{upload_seconds:>12.3f}{package_seconds + upload_seconds:>12.3f}')
+
+            raw_bytes, preprocessed_bytes = results[0][1][0], results[1][1][0]
+            print(f'  upload reduced by {raw_bytes - preprocessed_bytes} bytes '
+                  f'({100 * (raw_bytes - preprocessed_bytes) / raw_bytes:.1f}%)')
+
+
+if __name__ == '__main__':
+    main()
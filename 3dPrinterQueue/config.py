@@ -18,3 +18,19 @@ class Config:
 
     # Print Monitoring
     MONITOR_INTERVAL = 5  # seconds between status checks
+
+    # Print Telemetry
+    TELEMETRY_DIR = os.getenv('TELEMETRY_DIR', 'telemetry')
+    TELEMETRY_CAPACITY = int(os.getenv('TELEMETRY_CAPACITY', 2048))  # max samples kept per job
+
+    # G-code Preprocessing (applied to .gcode files before upload)
+    GCODE_PREPROCESS = os.getenv('GCODE_PREPROCESS', 'False').lower() == 'true'
+    GCODE_XYZ_PRECISION = int(os.getenv('GCODE_XYZ_PRECISION', 3))  # decimals for X/Y/Z/I/J/R
+    GCODE_E_PRECISION = int(os.getenv('GCODE_E_PRECISION', 5))  # decimals for extrusion
+    GCODE_CHUNK_SIZE = 1024 * 1024  # characters processed per chunk
+    # (max input size in bytes, deflate level); larger files trade ratio for speed
+    GCODE_COMPRESSION_LEVELS = [
+        (16 * 1024 * 1024, 6),
+        (128 * 1024 * 1024, 4),
+        (None, 1),
+    ]
@@ -0,0 +1,175 @@
+import os
+import re
+import time
+import zipfile
+from io import BytesIO
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+from config import Config
+
+
+GCODE_LOCATION = "Metadata/plate_1.gcode"
+
+# Comment lines the printer firmware relies on for progress, layer and object tracking
+KEEP_COMMENT_PREFIXES = (
+    '; CHANGE_LAYER',
+    '; Z_HEIGHT',
+    '; LAYER_HEIGHT',
+    '; layer num/total_layer_count',
+    '; FEATURE',
+    '; OBJECT_ID',
+    '; SKIPPABLE_START',
+    '; SKIPPABLE_END',
+    '; SKIPTYPE',
+    '; EXECUTABLE_BLOCK_START',
+    '; EXECUTABLE_BLOCK_END',
+    '; MACHINE_START_GCODE_END',
+)
+
+# The header block carries print time, layer count and filament info shown on the printer
+HEADER_BLOCK_START = '; HEADER_BLOCK_START'
+HEADER_BLOCK_END = '; HEADER_BLOCK_END'
+
+MOVE_COMMAND = re.compile(r'^G[0-3](?:\s|$)')
+
+
+class GcodePreprocessor:
+    def __init__(self, strip_comments: bool = True, normalize_precision: bool = True,
+                 xyz_precision: int = Config.GCODE_XYZ_PRECISION,
+                 e_precision: int = Config.GCODE_E_PRECISION,
+                 chunk_size: int = Config.GCODE_CHUNK_SIZE):
+        self.strip_comments = strip_comments
+        self.normalize_precision = normalize_precision
+        self.precision = {
+            'X': xyz_precision, 'Y': xyz_precision, 'Z': xyz_precision,
+            'I': xyz_precision, 'J': xyz_precision, 'R': xyz_precision,
+            'E': e_precision, 'F': 0
+        }
+        self.formats = {letter: f'%.{precision}f' for letter, precision in self.precision.items()}
+        self.parameter_pattern = self._build_parameter_pattern()
+        self.chunk_size = chunk_size
+        self._in_header = False
+
+    def process(self, lines: Iterable[str]) -> Iterator[str]:
+        # Yield transformed G-code in chunks of roughly chunk_size characters
+        self._in_header = False
+        chunk = []
+        chunk_length = 0
+
+        for line in lines:
+            transformed = self.transform_line(line)
+            if transformed is None:
+                continue
+
+            chunk.append(transformed)
+            chunk_length += len(transformed) + 1
+
+            if chunk_length >= self.chunk_size:
+                yield '\n'.join(chunk) + '\n'
+                chunk = []
+                chunk_length = 0
+
+        if chunk:
+            yield '\n'.join(chunk) + '\n'
+
+    def transform_line(self, line: str) -> Optional[str]:
+        line = line.strip()
+        if not line:
+            return None
+
+        if line.startswith(';'):
+            return self._transform_comment(line)
+
+        if self.strip_comments and ';' in line:
+            line = line.split(';', 1)[0].rstrip()
+            if not line:
+                return None
+
+        if self.normalize_precision and MOVE_COMMAND.match(line):
+            if '  ' in line or '\t' in line:
+                line = ' '.join(line.split())
+            line = self.parameter_pattern.sub(self._format_parameter, line)
+
+        return line
+
+    def _transform_comment(self, line: str) -> Optional[str]:
+        if not self.strip_comments:
+            return line
+
+        if line.startswith(HEADER_BLOCK_START):
+            self._in_header = True
+            return line
+
+        if self._in_header:
+            if line.startswith(HEADER_BLOCK_END):
+                self._in_header = False
+            return line
+
+        if line.startswith(KEEP_COMMENT_PREFIXES):
+            return line
+
+        return None
+
+    def _build_parameter_pattern(self):
+        # Only match values with more decimals than allowed or trailing zeros, so the
+        # Python callback is skipped for the parameters that are already compact
+        letters_by_precision: Dict[int, str] = {}
+        for letter, precision in self.precision.items():
+            letters_by_precision[precision] = letters_by_precision.get(precision, '') + letter
+
+        alternatives = [
+            rf'[{letters}]-?\d*\.(?:\d{{{precision + 1},}}|\d*0)'
+            for precision, letters in letters_by_precision.items()
+        ]
+        return re.compile(rf'(?<=\s)(?:{"|".join(alternatives)})(?=\s|$)')
+
+    def _format_parameter(self, match) -> str:
+        token = match.group(0)
+        formatted = self.formats[token[0]] % float(token[1:])
+        if '.' in formatted:
+            formatted = formatted.rstrip('0').rstrip('.')
+        if formatted == '-0':
+            formatted = '0'
+
+        # Never make a parameter longer than the slicer wrote it
+        if len(formatted) >= len(token) - 1:
+            return token
+        return token[0] + formatted
+
+
+def compression_level_for_size(size: int) -> int:
+    for max_size, level in Config.GCODE_COMPRESSION_LEVELS:
+        if max_size is None or size <= max_size:
+            return level
+    return Config.GCODE_COMPRESSION_LEVELS[-1][1]
+
+
+def create_preprocessed_3mf(file_path: str,
+                            preprocessor: Optional[GcodePreprocessor] = None) -> Tuple[BytesIO, Dict[str, Any]]:
+    preprocessor = preprocessor or GcodePreprocessor()
+    start_time = time.perf_counter()
+
+    input_bytes = os.path.getsize(file_path)
+    compression_level = compression_level_for_size(input_bytes)
+    output_bytes = 0
+
+    zip_buffer = BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=compression_level) as zipf:
+        with open(file_path, 'r') as source, zipf.open(GCODE_LOCATION, 'w') as target:
+            for chunk in preprocessor.process(source):
+                data = chunk.encode('utf-8')
+                output_bytes += len(data)
+                target.write(data)
+
+    archive_bytes = zip_buffer.tell()
+    zip_buffer.seek(0)
+
+    stats = {
+        'input_bytes': input_bytes,
+        'gcode_bytes': output_bytes,
+        'archive_bytes': archive_bytes,
+        'bytes_saved': input_bytes - output_bytes,
+        'compression_level': compression_level,
+        'elapsed_seconds': round(time.perf_counter() - start_time, 3)
+    }
+
+    return zip_buffer, stats
@@ -4,6 +4,7 @@ from config import Config
 from printer_controller import PrinterController
 from print_queue import PrintQueue
 from print_monitor import PrintMonitor
+from telemetry import TelemetryStore
 from api_server import APIServer
 
 
@@ -23,8 +24,9 @@ if __name__ == '__main__':
     print('\nInitializing components...')
     printer = PrinterController()
     queue = PrintQueue()
-    monitor = PrintMonitor(printer, queue)
-    api = APIServer(queue, printer)
+    telemetry = TelemetryStore()
+    monitor = PrintMonitor(printer, queue, telemetry)
+    api = APIServer(queue, printer, telemetry)
 
     # Register signal handler for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
@@ -61,6 +63,7 @@ if __name__ == '__main__':
     print(f'  GET  http://localhost:{Config.FLASK_PORT}/queue/status')
     print(f'  GET  http://localhost:{Config.FLASK_PORT}/queue/completed')
     print(f'  GET  http://localhost:{Config.FLASK_PORT}/queue/job/<job_id>')
+    print(f'  GET  http://localhost:{Config.FLASK_PORT}/queue/job/<job_id>/telemetry')
     print(f'  DELETE http://localhost:{Config.FLASK_PORT}/queue/remove/<job_id>')
     print(f'  GET  http://localhost:{Config.FLASK_PORT}/completion/<job_id>')
     print('\nPress Ctrl+C to stop the server')
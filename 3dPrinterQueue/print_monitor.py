@@ -5,9 +5,10 @@ from config import Config
 
 
 class PrintMonitor:
-    def __init__(self, printer_controller, print_queue):
+    def __init__(self, printer_controller, print_queue, telemetry_store):
         self.printer = printer_controller
         self.queue = print_queue
+        self.telemetry = telemetry_store
         self.monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
         self.current_job_id: Optional[str] = None
@@ -26,6 +27,7 @@ class PrintMonitor:
         self.monitoring = False
         if self.monitor_thread:
             self.monitor_thread.join(timeout=10)
+        self.telemetry.save_all()
         print('Print monitor stopped')
 
     def _monitor_loop(self):
@@ -54,8 +56,10 @@ class PrintMonitor:
         try:
             # Check if printer is still printing
             if self.printer.is_printing():
-                # Still printing, nothing to do
+                # Still printing, record progress
                 status = self.printer.get_status()
+                if 'status' in status:
+                    self.telemetry.record(self.current_job_id, status['status'])
                 print(f'Current job {self.current_job_id} is printing... '
                       f'{status.get("status", {}).get("print_percentage", 0)}% complete')
                 return
@@ -82,7 +86,8 @@ class PrintMonitor:
                     print(f'Job {self.current_job_id} ended with state: {gcode_state}')
                     self.queue.mark_job_completed(self.current_job_id, completion_data)
 
-                # Clear current job
+                # Persist telemetry and clear current job
+                self.telemetry.finish_job(self.current_job_id)
                 self.current_job_id = None
                 self.printer.current_print = None
 
@@ -4,6 +4,7 @@ from io import BytesIO
 from typing import Optional, Dict, Any
 import bambulabs_api as bl
 from config import Config
+from gcode_preprocessor import GCODE_LOCATION, create_preprocessed_3mf
 
 
 class PrinterController:
@@ -87,8 +88,7 @@ class PrinterController:
     def create_3mf_from_gcode(self, gcode_content: str) -> BytesIO:
         zip_buffer = BytesIO()
         with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            gcode_location = "Metadata/plate_1.gcode"
-            zipf.writestr(gcode_location, gcode_content)
+            zipf.writestr(GCODE_LOCATION, gcode_content)
         zip_buffer.seek(0)
         return zip_buffer
 
@@ -96,6 +96,8 @@ class PrinterController:
         if not self.is_connected or not self.printer:
             return {'success': False, 'error': 'Printer not connected'}
 
+        preprocess_stats = None
+
         try:
             # Check if file is already a .3mf file or gcode
             if file_path.endswith('.3mf'):
@@ -103,6 +105,15 @@ class PrinterController:
                 with open(file_path, 'rb') as file:
                     io_file = BytesIO(file.read())
                 upload_filename = file_name if file_name.endswith('.3mf') else f"{file_name}.3mf"
+            elif Config.GCODE_PREPROCESS:
+                # Strip comments and excess precision while packaging to shrink the upload
+                io_file, preprocess_stats = create_preprocessed_3mf(file_path)
+                print(f'Preprocessed {file_name}: {preprocess_stats["input_bytes"]} -> '
+                      f'{preprocess_stats["gcode_bytes"]} bytes of G-code '
+                      f'({preprocess_stats["bytes_saved"]} saved), '
+                      f'{preprocess_stats["archive_bytes"]} bytes packaged '
+                      f'in {preprocess_stats["elapsed_seconds"]}s')
+                upload_filename = file_name if file_name.endswith('.3mf') else f"{file_name}.3mf"
             else:
                 # File is gcode, need to convert to 3MF
                 with open(file_path, 'r') as file:
@@ -127,12 +138,17 @@ class PrinterController:
             self.printer.start_print(upload_filename, 1)
             self.current_print = file_name
 
-            return {
+            result = {
                 'success': True,
                 'message': f'Print job started successfully: {upload_filename}',
                 'filename': upload_filename
             }
 
+            if preprocess_stats:
+                result['preprocess'] = preprocess_stats
+
+            return result
+
         except Exception as e:
             print(f'Error starting print job: {e}')
             return {
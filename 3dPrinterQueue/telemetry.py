@@ -0,0 +1,218 @@
+import math
+import os
+import struct
+import sys
+import time
+from array import array
+from threading import Lock
+from typing import Dict, Any, Optional
+from config import Config
+
+
+# Column name -> (array typecode, printer status key)
+COLUMNS = [
+    ('timestamp', 'd', None),
+    ('print_percentage', 'f', 'print_percentage'),
+    ('layer_num', 'i', 'layer_num'),
+    ('remaining_time', 'i', 'mc_remaining_time'),
+    ('nozzle_temper', 'f', 'nozzle_temper'),
+    ('bed_temper', 'f', 'bed_temper'),
+    ('chamber_temper', 'f', 'chamber_temper'),
+]
+
+# Fraction of min_interval a sample may arrive early, so monitor loop jitter does not skip ticks
+INTERVAL_SLACK = 0.9
+
+# File layout: header, then each column's values stored contiguously (little-endian)
+FILE_MAGIC = b'PQTM'
+FILE_VERSION = 1
+HEADER_FORMAT = '<4sHHId'  # magic, version, column count, sample count, min interval
+
+
+class TelemetryBuffer:
+    """Fixed-size, column-oriented time series for a single print job.
+
+    When the buffer fills up every other sample is dropped and the minimum
+    spacing between samples doubles, so a job never holds more than
+    `capacity` samples no matter how long the print runs.
+    """
+
+    def __init__(self, capacity: int = Config.TELEMETRY_CAPACITY, min_interval: float = 0.0):
+        # Keep an even capacity so compaction always halves cleanly
+        self.capacity = max(2, capacity - capacity % 2)
+        self.min_interval = min_interval
+        self.count = 0
+        self.columns: Dict[str, array] = {
+            name: array(typecode, [0]) * self.capacity for name, typecode, _ in COLUMNS
+        }
+
+    def append(self, status: Dict[str, Any], timestamp: Optional[float] = None) -> bool:
+        timestamp = time.time() if timestamp is None else timestamp
+
+        last_timestamp = self.columns['timestamp'][self.count - 1] if self.count else None
+        if last_timestamp is not None and timestamp - last_timestamp < self.min_interval * INTERVAL_SLACK:
+            return False
+
+        if self.count == self.capacity:
+            self._compact()
+
+        index = self.count
+        for name, typecode, key in COLUMNS:
+            if key is None:
+                value = timestamp
+            else:
+                value = status.get(key)
+            self.columns[name][index] = _coerce(value, typecode)
+
+        self.count += 1
+        return True
+
+    def _compact(self):
+        # Keep even-indexed samples and double the spacing for new ones
+        half = self.count // 2
+        for name, column in self.columns.items():
+            column[:half] = column[0:self.count:2]
+            column[half:] = array(column.typecode, [0]) * (self.capacity - half)
+
+        self.min_interval = self.min_interval * 2 if self.min_interval else Config.MONITOR_INTERVAL * 2
+        self.count = half
+
+    def query(self, start: Optional[float] = None, end: Optional[float] = None,
+              resolution: Optional[int] = None) -> Dict[str, Any]:
+        timestamps = self.columns['timestamp']
+        indices = [
+            i for i in range(self.count)
+            if (start is None or timestamps[i] >= start) and (end is None or timestamps[i] <= end)
+        ]
+
+        # Thin out evenly, always keeping the last sample in range
+        if resolution and resolution > 0 and len(indices) > resolution:
+            step = len(indices) / resolution
+            indices = [indices[int(i * step)] for i in range(resolution - 1)] + [indices[-1]]
+
+        series = {
+            name: [_to_json(self.columns[name][i]) for i in indices]
+            for name, _, _ in COLUMNS
+        }
+
+        return {
+            'count': len(indices),
+            'total_samples': self.count,
+            'min_interval': self.min_interval,
+            'series': series
+        }
+
+    def to_bytes(self) -> bytes:
+        parts = [struct.pack(HEADER_FORMAT, FILE_MAGIC, FILE_VERSION, len(COLUMNS),
+                             self.count, self.min_interval)]
+        for name, _, _ in COLUMNS:
+            column = self.columns[name][:self.count]
+            if sys.byteorder == 'big':
+                column.byteswap()
+            parts.append(column.tobytes())
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, capacity: int = Config.TELEMETRY_CAPACITY) -> 'TelemetryBuffer':
+        header_size = struct.calcsize(HEADER_FORMAT)
+        magic, version, column_count, count, min_interval = struct.unpack(
+            HEADER_FORMAT, data[:header_size]
+        )
+
+        if magic != FILE_MAGIC or version != FILE_VERSION or column_count != len(COLUMNS):
+            raise ValueError('Unsupported telemetry file format')
+
+        expected_size = header_size + count * sum(array(typecode).itemsize for _, typecode, _ in COLUMNS)
+        if len(data) != expected_size:
+            raise ValueError(f'Telemetry file is {len(data)} bytes, expected {expected_size}')
+
+        # Keep room for every stored sample; capacity must stay even and at least count
+        buffer = cls(max(capacity, count + count % 2), min_interval)
+        offset = header_size
+        for name, typecode, _ in COLUMNS:
+            column = array(typecode)
+            size = count * column.itemsize
+            column.frombytes(data[offset:offset + size])
+            if sys.byteorder == 'big':
+                column.byteswap()
+            buffer.columns[name][:count] = column
+            offset += size
+
+        buffer.count = count
+        return buffer
+
+
+class TelemetryStore:
+    """Keeps the buffer for jobs being printed and persists them per job on disk."""
+
+    def __init__(self):
+        self.buffers: Dict[str, TelemetryBuffer] = {}
+        self.lock = Lock()
+        self.data_dir = Config.TELEMETRY_DIR
+
+    def record(self, job_id: str, status: Dict[str, Any]) -> bool:
+        with self.lock:
+            buffer = self.buffers.get(job_id)
+            if buffer is None:
+                buffer = self._load(job_id) or TelemetryBuffer()
+                self.buffers[job_id] = buffer
+            return buffer.append(status)
+
+    def finish_job(self, job_id: str):
+        # Persist and release the in-memory buffer once a job ends
+        with self.lock:
+            buffer = self.buffers.pop(job_id, None)
+            if buffer is not None:
+                self._save(job_id, buffer)
+
+    def save_all(self):
+        with self.lock:
+            for job_id, buffer in self.buffers.items():
+                self._save(job_id, buffer)
+
+    def get_telemetry(self, job_id: str, start: Optional[float] = None, end: Optional[float] = None,
+                      resolution: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            buffer = self.buffers.get(job_id) or self._load(job_id)
+            if buffer is None:
+                return None
+            return buffer.query(start, end, resolution)
+
+    def _file_path(self, job_id: str) -> str:
+        return os.path.join(self.data_dir, f'{os.path.basename(job_id)}.telemetry')
+
+    def _save(self, job_id: str, buffer: TelemetryBuffer):
+        try:
+            os.makedirs(self.data_dir, exist_ok=True)
+            with open(self._file_path(job_id), 'wb') as f:
+                f.write(buffer.to_bytes())
+        except Exception as e:
+            print(f'Error saving telemetry for job {job_id}: {e}')
+
+    def _load(self, job_id: str) -> Optional[TelemetryBuffer]:
+        file_path = self._file_path(job_id)
+        if not os.path.exists(file_path):
+            return None
+
+        try:
+            with open(file_path, 'rb') as f:
+                return TelemetryBuffer.from_bytes(f.read())
+        except Exception as e:
+            print(f'Error loading telemetry for job {job_id}: {e}')
+            return None
+
+
+def _coerce(value: Any, typecode: str):
+    # Missing readings are stored as NaN for float columns and -1 for integer columns
+    try:
+        if typecode in ('f', 'd'):
+            return float(value) if value is not None else math.nan
+        return int(value) if value is not None else -1
+    except (TypeError, ValueError):
+        return math.nan if typecode in ('f', 'd') else -1
+
+
+def _to_json(value):
+    if isinstance(value, float):
+        return None if math.isnan(value) else round(value, 2)
+    return None if value == -1 else value